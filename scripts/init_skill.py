@@ -11,7 +11,9 @@ Example:
 """
 
 import argparse
+import functools
 import os
+import string
 from pathlib import Path
 
 SKILL_MD_TEMPLATE = '''---
@@ -97,6 +99,48 @@ if __name__ == "__main__":
 '''
 
 
+# Precompiled once at import; Template.substitute skips str.format's format-spec parsing.
+# Literal "$" is escaped first so the templates only need str.format-style escaping.
+SKILL_MD_TMPL = string.Template(
+    SKILL_MD_TEMPLATE.replace("$", "$$")
+    .replace("{skill_name}", "$skill_name")
+    .replace("{skill_title}", "$skill_title")
+    .replace("{{", "{")
+    .replace("}}", "}")
+)
+SCRIPT_TMPL = string.Template(
+    SCRIPT_TEMPLATE.replace("$", "$$")
+    .replace("{script_name}", "$script_name")
+    .replace("{{", "{")
+    .replace("}}", "}")
+)
+REFERENCE_BYTES = REFERENCE_TEMPLATE.encode("utf-8")
+# create_skill only ever writes the "example" script, so render it once at import
+EXAMPLE_SCRIPT_BYTES = SCRIPT_TMPL.substitute(script_name="example").encode("utf-8")
+
+
+@functools.lru_cache(maxsize=256)
+def _render_skill_md(skill_name: str) -> bytes:
+    """Render and encode SKILL.md, cached for batch callers creating similar skills."""
+    skill_title = skill_name.replace("-", " ").replace("_", " ").title()
+    return SKILL_MD_TMPL.substitute(skill_name=skill_name, skill_title=skill_title).encode("utf-8")
+
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def _write_file(path: Path, payload: bytes) -> None:
+    """Write pre-encoded bytes to a new file, bypassing the buffered text IO layers."""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        # os.write may return a short count, so keep writing until the payload is exhausted
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 def create_skill(skill_name: str, output_path: str) -> None:
     """Create a new skill directory with template files."""
 
@@ -106,31 +150,27 @@ def create_skill(skill_name: str, output_path: str) -> None:
 
     skill_path = Path(output_path) / skill_name
 
-    if skill_path.exists():
-        raise FileExistsError(f"Skill directory already exists: {skill_path}")
+    # Create directories (mkdir fails if the skill already exists, so no separate exists() check)
+    try:
+        os.makedirs(skill_path, exist_ok=False)
+    except FileExistsError:
+        raise FileExistsError(f"Skill directory already exists: {skill_path}") from None
 
-    # Create directories
-    (skill_path / "scripts").mkdir(parents=True, exist_ok=True)
-    (skill_path / "references").mkdir(parents=True, exist_ok=True)
-    (skill_path / "assets").mkdir(parents=True, exist_ok=True)
+    # Parent exists now, so the leaves are created directly without re-walking it
+    for subdir in ("scripts", "references", "assets"):
+        os.mkdir(skill_path / subdir)
 
     # Create SKILL.md
-    skill_title = skill_name.replace("-", " ").replace("_", " ").title()
-    skill_md_content = SKILL_MD_TEMPLATE.format(
-        skill_name=skill_name,
-        skill_title=skill_title
-    )
-    (skill_path / "SKILL.md").write_text(skill_md_content)
+    _write_file(skill_path / "SKILL.md", _render_skill_md(skill_name))
 
     # Create example reference
-    (skill_path / "references" / "example.md").write_text(REFERENCE_TEMPLATE)
+    _write_file(skill_path / "references" / "example.md", REFERENCE_BYTES)
 
     # Create example script
-    script_content = SCRIPT_TEMPLATE.format(script_name="example")
-    (skill_path / "scripts" / "example.py").write_text(script_content)
+    _write_file(skill_path / "scripts" / "example.py", EXAMPLE_SCRIPT_BYTES)
 
     # Create .gitkeep for assets
-    (skill_path / "assets" / ".gitkeep").write_text("")
+    _write_file(skill_path / "assets" / ".gitkeep", b"")
 
     print(f"Created skill: {skill_path}")
     print(f"")
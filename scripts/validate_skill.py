@@ -3,8 +3,9 @@
 Validate a Claude skill structure and contents.
 
 Usage:
-    python validate_skill.py <path-to-skill>
+    python validate_skill.py <path-to-skill> [<path-to-skill> ...]
     python validate_skill.py ./skills/engineering/code-review/
+    python validate_skill.py ./skills/*/*/
 
 Checks:
     - SKILL.md exists and has valid YAML frontmatter
@@ -14,28 +15,98 @@ Checks:
 """
 
 import argparse
+import os
 import re
+import string
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import AnyStr, List, Optional, Tuple
+
+RECOMMENDED_SECTIONS = ["When to Use", "Workflow", "Example"]
+
+# Single case-insensitive pass over the (undecoded) body instead of lowercasing it per section
+_SECTION_RE = re.compile(
+    b"|".join(re.escape(section.encode("ascii")) for section in RECOMMENDED_SECTIONS), re.IGNORECASE
+)
+_TRIGGER_RE = re.compile(r"when|use|should|for", re.IGNORECASE)
+
+# Equivalent to ^[a-z][a-z0-9-]*$ without going through the regex engine
+_NAME_FIRST_CHARS = frozenset(string.ascii_lowercase)
+_STRIP_NAME_CHARS = str.maketrans("", "", string.ascii_lowercase + string.digits + "-")
+
+
+def _is_valid_name(name: str) -> bool:
+    """Check a skill name is kebab-case: a lowercase letter, then lowercase letters, digits or hyphens."""
+    return name[:1] in _NAME_FIRST_CHARS and not name.translate(_STRIP_NAME_CHARS)
+
+
+def _parse_fields(text: str) -> dict:
+    """Parse 'key: value' lines from a frontmatter block."""
+    frontmatter = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition(":")
+        if sep:
+            frontmatter[key.strip()] = value.strip().strip('"\'')
+    return frontmatter
+
+
+def _frontmatter_span(content: AnyStr) -> Optional[Tuple[int, int]]:
+    """Return the (start, end) offsets of the frontmatter block, or None.
+
+    The opening line must be '---' (trailing whitespace allowed) and the block
+    ends at the next line starting with '---'. Works on both str and bytes so
+    the two parsers share one delimiter rule without converting between them.
+    """
+    if isinstance(content, str):
+        newline, delimiter, closing = "\n", "---", "\n---"
+    else:
+        newline, delimiter, closing = b"\n", b"---", b"\n---"
+
+    first_nl = content.find(newline)
+    if first_nl < 0 or content[:first_nl].rstrip() != delimiter:
+        return None
+
+    end = content.find(closing, first_nl)
+    if end < 0:
+        return None
+
+    return first_nl + 1, end
 
 
 def parse_frontmatter(content: str) -> Tuple[dict, str]:
     """Parse YAML frontmatter from markdown content."""
-    if not content.startswith("---"):
+    span = _frontmatter_span(content)
+    if span is None:
         return {}, content
 
-    parts = content.split("---", 2)
-    if len(parts) < 3:
-        return {}, content
+    start, end = span
+    return _parse_fields(content[start:end]), content[end + 4:]
 
-    frontmatter = {}
-    for line in parts[1].strip().split("\n"):
-        if ":" in line:
-            key, value = line.split(":", 1)
-            frontmatter[key.strip()] = value.strip().strip('"\'')
 
-    return frontmatter, parts[2]
+def parse_frontmatter_bytes(raw: bytes) -> Tuple[dict, bytes]:
+    """Parse YAML frontmatter from raw markdown, decoding only the frontmatter block."""
+    span = _frontmatter_span(raw)
+    if span is None:
+        return {}, raw
+
+    start, end = span
+    return _parse_fields(raw[start:end].decode("utf-8")), raw[end + 4:]
+
+
+def _body_too_short(body: bytes, min_chars: int = 100) -> bool:
+    """Check whether the stripped body has fewer than min_chars characters.
+
+    A UTF-8 character is at most 4 bytes, so a body of at least 4 * min_chars
+    bytes is long enough without decoding. That shortcut only holds when the
+    ASCII-stripped bytes start and end with an ASCII byte; otherwise leading or
+    trailing Unicode whitespace (U+00A0, U+3000, ...) that str.strip() removes
+    could still be present, so the body is decoded and measured in characters.
+    """
+    stripped = body.strip()
+    if len(stripped) >= 4 * min_chars and stripped[0] < 0x80 and stripped[-1] < 0x80:
+        return False
+    return len(stripped.decode("utf-8").strip()) < min_chars
 
 
 def validate_skill(skill_path: Path) -> List[str]:
@@ -48,87 +119,122 @@ def validate_skill(skill_path: Path) -> List[str]:
         errors.append("SKILL.md file not found")
         return errors
 
-    content = skill_md.read_text()
-    frontmatter, body = parse_frontmatter(content)
+    # Body checks are ASCII-only, so the body stays as bytes and only the frontmatter is decoded
+    frontmatter, body = parse_frontmatter_bytes(skill_md.read_bytes())
 
     # Check required fields
     if "name" not in frontmatter:
         errors.append("Missing required field 'name' in frontmatter")
-    elif not re.match(r"^[a-z][a-z0-9-]*$", frontmatter["name"]):
+    elif not _is_valid_name(frontmatter["name"]):
         errors.append(f"Invalid name format: {frontmatter['name']}. Use lowercase letters, numbers, and hyphens.")
 
     if "description" not in frontmatter:
         errors.append("Missing required field 'description' in frontmatter")
     else:
         desc = frontmatter["description"]
-        if len(desc) < 50:
-            errors.append(f"Description too short ({len(desc)} chars). Should be at least 50 characters.")
+        desc_len = len(desc)
+        if desc_len < 50:
+            errors.append(f"Description too short ({desc_len} chars). Should be at least 50 characters.")
         if "TODO" in desc:
             errors.append("Description contains TODO placeholder")
-        if not any(trigger in desc.lower() for trigger in ["when", "use", "should", "for"]):
+        if not _TRIGGER_RE.search(desc):
             errors.append("Description should explain when to use this skill")
 
-    # Check body content
-    if len(body.strip()) < 100:
+    # Check body content; a stub body subsumes the TODO and section checks, so skip them
+    if _body_too_short(body):
         errors.append("SKILL.md body is too short. Add detailed instructions.")
-
-    if "TODO" in body:
-        errors.append("SKILL.md body contains TODO placeholders")
-
-    # Check for recommended sections
-    recommended_sections = ["When to Use", "Workflow", "Example"]
-    for section in recommended_sections:
-        if section.lower() not in body.lower():
-            errors.append(f"Missing recommended section: '{section}'")
+    else:
+        if b"TODO" in body:
+            errors.append("SKILL.md body contains TODO placeholders")
+
+        # Check for recommended sections
+        found = set()
+        for match in _SECTION_RE.finditer(body):
+            found.add(match.group(0).decode("ascii").lower())
+            if len(found) == len(RECOMMENDED_SECTIONS):
+                break
+        for section in RECOMMENDED_SECTIONS:
+            if section.lower() not in found:
+                errors.append(f"Missing recommended section: '{section}'")
 
     # Check directory structure
     for subdir in ["scripts", "references", "assets"]:
         subpath = skill_path / subdir
-        if subpath.exists() and subpath.is_dir():
-            files = list(subpath.glob("*"))
-            # Check for placeholder files
-            for f in files:
-                if f.name != ".gitkeep" and f.is_file():
-                    file_content = f.read_text()
-                    if "TODO" in file_content:
-                        errors.append(f"File {subdir}/{f.name} contains TODO placeholders")
+        if not subpath.is_dir():
+            continue
+        # Check for placeholder files; scandir's cached entry type avoids a stat per file
+        with os.scandir(subpath) as entries:
+            for entry in entries:
+                if entry.name == ".gitkeep" or not entry.is_file(follow_symlinks=False):
+                    continue
+                with open(entry.path, "rb") as fh:
+                    if b"TODO" in fh.read():
+                        errors.append(f"File {subdir}/{entry.name} contains TODO placeholders")
 
     return errors
 
 
+def _validate_isolated(skill_path: Path) -> List[str]:
+    """Validate a skill, reporting read/decode failures as errors instead of raising."""
+    try:
+        return validate_skill(skill_path)
+    except (OSError, UnicodeDecodeError) as e:
+        return [f"Could not read skill files: {e}"]
+
+
+def validate_many(paths: List[Path]) -> List[Tuple[Path, List[str]]]:
+    """Validate several skills concurrently and return (path, errors) pairs in input order.
+
+    Validation is dominated by file reads and directory scans, which release
+    the GIL, so a thread pool overlaps the I/O across skills. A skill whose
+    files cannot be read or decoded gets an error entry rather than aborting
+    the whole batch.
+    """
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+        return list(zip(paths, executor.map(_validate_isolated, paths)))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate a Claude skill structure",
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
-    parser.add_argument("skill_path", help="Path to the skill directory")
+    parser.add_argument("skill_paths", nargs="+", metavar="skill_path", help="Paths to one or more skill directories")
     parser.add_argument("--strict", action="store_true", help="Fail on warnings too")
 
     args = parser.parse_args()
-    skill_path = Path(args.skill_path)
-
-    if not skill_path.exists():
-        print(f"Error: Path does not exist: {skill_path}")
-        sys.exit(1)
-
-    if not skill_path.is_dir():
-        print(f"Error: Path is not a directory: {skill_path}")
-        sys.exit(1)
-
-    print(f"Validating skill: {skill_path}")
-    print("-" * 50)
-
-    errors = validate_skill(skill_path)
-
-    if errors:
-        print("Validation FAILED:")
-        for error in errors:
-            print(f"  - {error}")
-        sys.exit(1)
-    else:
-        print("Validation PASSED")
-        print("Skill is ready for use!")
-        sys.exit(0)
+    skill_paths = [Path(p) for p in args.skill_paths]
+
+    for skill_path in skill_paths:
+        if not skill_path.exists():
+            print(f"Error: Path does not exist: {skill_path}")
+            sys.exit(1)
+
+        if not skill_path.is_dir():
+            print(f"Error: Path is not a directory: {skill_path}")
+            sys.exit(1)
+
+    results = validate_many(skill_paths)
+
+    failed = False
+    for i, (skill_path, errors) in enumerate(results):
+        if i:
+            print()
+        print(f"Validating skill: {skill_path}")
+        print("-" * 50)
+
+        if errors:
+            failed = True
+            print("Validation FAILED:")
+            for error in errors:
+                print(f"  - {error}")
+        else:
+            print("Validation PASSED")
+            print("Skill is ready for use!")
+
+    sys.exit(1 if failed else 0)
 
 
 if __name__ == "__main__":